@@ -0,0 +1,178 @@
+"""
+MCP Cassette - Record and replay SalesforceMCPClient tool calls
+Lets us profile and regression-test without a live Salesforce org
+"""
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.salesforce_client import SalesforceMCPClient, Content, ToolResult
+
+
+# Keys whose values never get written to a cassette
+SECRET_KEYS = {"password", "security_token", "securitytoken", "token", "sessionid", "session_id", "authorization", "access_token"}
+REDACTED = "***REDACTED***"
+
+
+def redact(value, secrets=()):
+    """Redact secret keys and exact secret values from a JSON-like value"""
+    if isinstance(value, dict):
+        return {
+            k: REDACTED if k.lower() in SECRET_KEYS else redact(v, secrets)
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(v, secrets) for v in value]
+    if isinstance(value, str) and value in secrets:
+        return REDACTED
+    return value
+
+
+def redact_text(text: str, secrets=()):
+    """Redact secret values anywhere inside free-form text (error messages)"""
+    for secret in secrets:
+        text = text.replace(secret, REDACTED)
+    return text
+
+
+def _request_key(tool_name: str, arguments: dict):
+    """
+    Stable key used to match a replayed call to its recording
+    Built from redacted arguments on both sides, so no secret reaches the key
+    """
+    return json.dumps([tool_name, arguments], sort_keys=True, separators=(",", ":"))
+
+
+def load_cassette(path: str):
+    """Read every entry (tool calls and inbound queries) from a cassette"""
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                entries.append(json.loads(line))
+    return entries
+
+
+class ReplayedError(Exception):
+    """Error raised by the replay client when the recorded call had failed"""
+
+
+class Cassette:
+    """
+    Compact on-disk recording of MCP traffic (one JSON object per line)
+    Tool call line: {"tool", "arguments", "at", "elapsed", "response" | "error"}
+    Inbound query line: {"query", "at"}
+    """
+
+    def __init__(self, path: str, secrets=None):
+        self.path = path
+        # Literal secret values (password, token) redacted on exact match only
+        self.secrets = {s for s in (secrets or []) if s}
+        self.started = time.perf_counter()
+
+        # Start a fresh cassette for every recording session; a single writer
+        # thread keeps file I/O off the event loop and lines in call order
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        print(f"📼 Recording MCP traffic to {self.path}")
+
+    def redact(self, value):
+        """Redact secret keys and exact secret values from a JSON-like value"""
+        return redact(value, self.secrets)
+
+    def _write(self, line: str):
+        self._file.write(line + "\n")
+        self._file.flush()
+
+    async def _append(self, entry: dict):
+        line = json.dumps(entry, separators=(",", ":"))
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(self._executor, self._write, line)
+
+    async def record(self, tool_name: str, arguments: dict, started: float, elapsed: float, result=None, error=None):
+        """Append one tool call to the cassette"""
+        entry = {
+            "tool": tool_name,
+            "arguments": self.redact(arguments),
+            "at": round(started - self.started, 6),
+            "elapsed": round(elapsed, 6),
+        }
+
+        if error is not None:
+            entry["error"] = redact_text(str(error), self.secrets)
+        else:
+            entry["response"] = [
+                self.redact(json.loads(content.text))
+                for content in result.content
+                if hasattr(content, 'text')
+            ]
+
+        await self._append(entry)
+
+    async def record_query(self, query: str):
+        """Append an inbound /query request so the traffic can be driven again"""
+        await self._append({
+            "query": self.redact(query),
+            "at": round(time.perf_counter() - self.started, 6),
+        })
+
+    def close(self):
+        """Flush pending writes and close the cassette file"""
+        self._executor.shutdown(wait=True)
+        self._file.close()
+
+
+class ReplayMCPClient:
+    """
+    Drop-in replacement for SalesforceMCPClient that serves recorded responses
+    speed=1.0 keeps original timings, 10.0 replays 10x faster, 0 disables delays
+    loop=True restarts a request's recordings once used up (strict by default)
+    secrets should match the ones used while recording so live arguments redact the same way
+    """
+
+    # Tool listing is static, so reuse the live client's definition
+    list_tools = SalesforceMCPClient.list_tools
+
+    def __init__(self, path: str, speed: float = 1.0, loop: bool = False, secrets=None):
+        self.path = path
+        self.speed = speed
+        self.loop = loop
+        self.secrets = {s for s in (secrets or []) if s}
+        self._entries = {}
+
+        count = 0
+        for entry in load_cassette(path):
+            if "tool" not in entry:
+                continue
+            key = _request_key(entry["tool"], entry["arguments"])
+            self._entries.setdefault(key, []).append(entry)
+            count += 1
+
+        # Per-key cursor so repeated identical calls replay in recorded order
+        self._cursors = {key: 0 for key in self._entries}
+        print(f"📼 Replaying {count} recorded MCP calls from {self.path}")
+
+    async def call_tool(self, tool_name: str, arguments: dict):
+        """Serve the next recorded response for this exact request"""
+        key = _request_key(tool_name, redact(arguments, self.secrets))
+        entries = self._entries.get(key)
+        if not entries:
+            raise ValueError(f"No recorded response for tool '{tool_name}' with arguments {arguments}")
+
+        cursor = self._cursors[key]
+        if cursor >= len(entries):
+            if not self.loop:
+                raise ValueError(f"Recorded responses for tool '{tool_name}' used up after {len(entries)} calls")
+            print(f"⚠️ Replay wrapped around for tool '{tool_name}' (call {cursor + 1}, {len(entries)} recorded)")
+        entry = entries[cursor % len(entries)]
+        self._cursors[key] = cursor + 1
+
+        if self.speed > 0:
+            await asyncio.sleep(entry["elapsed"] / self.speed)
+
+        if "error" in entry:
+            raise ReplayedError(entry["error"])
+
+        return ToolResult([Content(json.dumps(data, indent=2)) for data in entry["response"]])
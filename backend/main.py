@@ -5,9 +5,19 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from backend.mcp_salesforce import SalesforceMCP
+from contextlib import asynccontextmanager
 import asyncio
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Flush the recording cassette, if any
+    if mcp.cassette is not None:
+        mcp.cassette.close()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # CORS
 app.add_middleware(
@@ -49,6 +59,10 @@ async def query(request: QueryRequest):
     """Process query using MCP pattern"""
     q = request.query.lower()
     
+    # Capture inbound traffic so it can be driven again (backend/replay_driver.py)
+    if mcp.cassette is not None:
+        await mcp.cassette.record_query(request.query)
+    
     print(f"\n{'='*60}")
     print(f"📥 Query: {q}")
     print(f"{'='*60}")
@@ -3,6 +3,7 @@ Salesforce MCP Wrapper - Following boss's example pattern
 """
 import asyncio
 from backend.salesforce_client import SalesforceMCPClient
+from backend.cassette import Cassette, ReplayMCPClient
 import os
 from dotenv import load_dotenv
 import json
@@ -22,18 +23,45 @@ class SalesforceMCP:
         self.security_token = os.getenv("SALESFORCE_SECURITY_TOKEN")
         self.login_url = os.getenv("SALESFORCE_DOMAIN", "https://login.salesforce.com")
         
+        # Record/replay of tool calls (see backend/cassette.py)
+        record_path = os.getenv("MCP_RECORD_CASSETTE")
+        replay_path = os.getenv("MCP_REPLAY_CASSETTE")
+        
+        if record_path and replay_path:
+            raise ValueError("Set only one of MCP_RECORD_CASSETTE or MCP_REPLAY_CASSETTE")
+        
+        self.client = None
+        self.cassette = None
+        self.replay_client = None
+        
+        if replay_path:
+            # Replay needs no live org, so credentials are optional
+            self.replay_client = ReplayMCPClient(
+                replay_path,
+                speed=float(os.getenv("MCP_REPLAY_SPEED", "1.0")),
+                loop=os.getenv("MCP_REPLAY_LOOP", "").lower() in ("1", "true", "yes"),
+                secrets=[self.password, self.security_token]
+            )
+            return
+        
         if not all([self.username, self.password, self.security_token]):
             raise ValueError("Missing Salesforce credentials in .env")
         
-        self.client = None
+        if record_path:
+            self.cassette = Cassette(record_path, secrets=[self.password, self.security_token])
     
     async def initialize(self):
         """Initialize the MCP client (like session.initialize())"""
+        if self.replay_client is not None:
+            self.client = self.replay_client
+            return self.client
+        
         self.client = SalesforceMCPClient(
             username=self.username,
             password=self.password,
             security_token=self.security_token,
-            login_url=self.login_url
+            login_url=self.login_url,
+            cassette=self.cassette
         )
         return self.client
     
@@ -0,0 +1,78 @@
+"""
+Replay Driver - Drive recorded /query traffic back through the API
+Usage:
+    MCP_REPLAY_CASSETTE=traffic.jsonl MCP_REPLAY_SPEED=10 python -m backend.replay_driver
+Requests arrive at their recorded offsets divided by MCP_REPLAY_SPEED (0 = all at once)
+"""
+import asyncio
+import os
+import sys
+import time
+
+from backend.cassette import load_cassette
+
+
+def _failed(result):
+    """main.query reports errors (and unmatched queries) in the response, not by raising"""
+    return not result or str(result.get("response", "")).startswith("❌")
+
+
+async def drive(path: str, speed: float = 1.0, handler=None):
+    """
+    Replay every recorded /query at its original (scaled) arrival time
+    handler(text) returns the /query response; defaults to backend.main.query
+    Failed requests are counted as errors and left out of latency/throughput
+    """
+    queries = [entry for entry in load_cassette(path) if "query" in entry]
+    if not queries:
+        raise ValueError(f"No recorded /query requests in {path}")
+
+    if handler is None:
+        # Imported here so the app's SalesforceMCP picks up the replay env vars
+        from backend.main import query, QueryRequest
+
+        async def handler(text):
+            return await query(QueryRequest(query=text))
+
+    first = queries[0]["at"]
+    latencies = []
+    errors = []
+
+    async def send(entry):
+        if speed > 0:
+            await asyncio.sleep((entry["at"] - first) / speed)
+        started = time.perf_counter()
+        result = await handler(entry["query"])
+        elapsed = time.perf_counter() - started
+        if _failed(result):
+            errors.append((entry["query"], (result or {}).get("response")))
+        else:
+            latencies.append(elapsed)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(send(entry) for entry in queries))
+    total = time.perf_counter() - started
+
+    for text, response in errors:
+        print(f"❌ Replay failed for '{text}': {response}")
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": len(errors),
+        "seconds": round(total, 4),
+        "throughput": round(len(latencies) / total, 2) if latencies and total > 0 else None,
+        "p50_ms": round(latencies[len(latencies) // 2] * 1000, 2) if latencies else None,
+        "max_ms": round(latencies[-1] * 1000, 2) if latencies else None,
+    }
+
+
+if __name__ == "__main__":
+    path = os.getenv("MCP_REPLAY_CASSETTE")
+    if not path:
+        raise SystemExit("Set MCP_REPLAY_CASSETTE to the cassette to replay")
+
+    stats = asyncio.run(drive(path, speed=float(os.getenv("MCP_REPLAY_SPEED", "1.0"))))
+    print(f"\n📊 Replay results: {stats}")
+    if stats["errors"]:
+        sys.exit(1)
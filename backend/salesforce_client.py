@@ -5,6 +5,19 @@ Uses MCP SDK with ClientSession
 import asyncio
 from typing import Optional
 import json
+import time
+
+
+class Content:
+    """Tool result content (like TextContent in MCP responses)"""
+    def __init__(self, text):
+        self.text = text
+
+
+class ToolResult:
+    """Tool call result (like CallToolResult in MCP responses)"""
+    def __init__(self, content):
+        self.content = content
 
 
 class SalesforceMCPClient:
@@ -13,12 +26,15 @@ class SalesforceMCPClient:
     This creates a simple MCP-like interface
     """
     
-    def __init__(self, username: str, password: str, security_token: str, login_url: str):
+    def __init__(self, username: str, password: str, security_token: str, login_url: str, cassette=None):
         self.username = username
         self.password = password
         self.security_token = security_token
         self.login_url = login_url
         
+        # Optional backend.cassette.Cassette that records every tool call
+        self.cassette = cassette
+        
         # Import here to avoid issues if not installed
         from simple_salesforce import Salesforce
         
@@ -55,6 +71,31 @@ class SalesforceMCPClient:
         Call a tool (similar to session.call_tool in the example)
         This follows the MCP pattern
         """
+        if self.cassette is None:
+            return await self._dispatch(tool_name, arguments)
+        
+        started = time.perf_counter()
+        try:
+            result = await self._dispatch(tool_name, arguments)
+        except Exception as e:
+            await self._record(tool_name, arguments, started, error=e)
+            raise
+        
+        await self._record(tool_name, arguments, started, result=result)
+        return result
+    
+    async def _record(self, tool_name: str, arguments: dict, started: float, result=None, error=None):
+        """Record a tool call; recording failures never change live behaviour"""
+        try:
+            await self.cassette.record(
+                tool_name, arguments, started, time.perf_counter() - started,
+                result=result, error=error
+            )
+        except Exception as e:
+            print(f"⚠️ Failed to record '{tool_name}' call: {e}")
+    
+    async def _dispatch(self, tool_name: str, arguments: dict):
+        """Route a tool call to its implementation"""
         if tool_name == "query":
             return await self._execute_query(arguments.get("soql", ""))
         
@@ -80,16 +121,7 @@ class SalesforceMCPClient:
         loop = asyncio.get_event_loop()
         result = await loop.run_in_executor(None, self.sf.query, soql)
         
-        # Format response similar to MCP response
-        class Content:
-            def __init__(self, text):
-                self.text = text
-        
-        class ToolResult:
-            def __init__(self, content):
-                self.content = content
-        
-        # Format the result
+        # Format the result similar to MCP response
         formatted_result = {
             "totalSize": result["totalSize"],
             "records": result["records"]
@@ -106,14 +138,6 @@ class SalesforceMCPClient:
         sf_object = getattr(self.sf, obj_type)
         result = await loop.run_in_executor(None, sf_object.create, fields)
         
-        class Content:
-            def __init__(self, text):
-                self.text = text
-        
-        class ToolResult:
-            def __init__(self, content):
-                self.content = content
-        
         formatted_result = {
             "success": True,
             "id": result["id"],
@@ -131,14 +155,6 @@ class SalesforceMCPClient:
         sf_object = getattr(self.sf, obj_type)
         await loop.run_in_executor(None, sf_object.update, record_id, fields)
         
-        class Content:
-            def __init__(self, text):
-                self.text = text
-        
-        class ToolResult:
-            def __init__(self, content):
-                self.content = content
-        
         formatted_result = {
             "success": True,
             "id": record_id,
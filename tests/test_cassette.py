@@ -0,0 +1,175 @@
+"""
+Tests for MCP cassette record/replay
+"""
+import asyncio
+import json
+
+import pytest
+
+from backend.salesforce_client import SalesforceMCPClient, Content, ToolResult
+from backend.cassette import Cassette, ReplayMCPClient, ReplayedError, REDACTED
+
+
+def make_client(cassette, dispatch):
+    """Client with a stubbed _dispatch, skipping the live Salesforce login"""
+    client = SalesforceMCPClient.__new__(SalesforceMCPClient)
+    client.cassette = cassette
+    client._dispatch = dispatch
+    return client
+
+
+def result(data):
+    return ToolResult([Content(json.dumps(data, indent=2))])
+
+
+def record(path, calls, secrets=None):
+    """Record (tool, arguments, response-or-exception) tuples through call_tool"""
+    async def run():
+        cassette = Cassette(str(path), secrets=secrets)
+        responses = iter([response for _, _, response in calls])
+
+        async def dispatch(tool_name, arguments):
+            response = next(responses)
+            if isinstance(response, Exception):
+                raise response
+            return result(response)
+
+        client = make_client(cassette, dispatch)
+        for tool_name, arguments, _ in calls:
+            try:
+                await client.call_tool(tool_name, arguments)
+            except Exception:
+                pass
+        cassette.close()
+
+    asyncio.run(run())
+
+
+def replay(path, calls, **kwargs):
+    async def run():
+        client = ReplayMCPClient(str(path), speed=0, **kwargs)
+        out = []
+        for tool_name, arguments in calls:
+            r = await client.call_tool(tool_name, arguments)
+            out.append(json.loads(r.content[0].text))
+        return out
+
+    return asyncio.run(run())
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / "c.jsonl"
+    data = {"totalSize": 1, "records": [{"Name": "Acme", "Phone": "555"}]}
+    record(path, [("query", {"soql": "SELECT Name FROM Account"}, data)])
+
+    assert replay(path, [("query", {"soql": "SELECT Name FROM Account"})]) == [data]
+
+
+def test_redacted_arguments_still_match(tmp_path):
+    path = tmp_path / "c.jsonl"
+    args = {"object": "Contact", "fields": {"Token": "abc", "LastName": "pw"}}
+    record(path, [("create", args, {"success": True, "id": "003A"})], secrets=["pw"])
+
+    text = path.read_text()
+    assert "abc" not in text
+    assert REDACTED in text
+    assert replay(path, [("create", args)], secrets=["pw"]) == [{"success": True, "id": "003A"}]
+    assert "key" not in json.loads(text)
+
+
+def test_secret_values_redacted_on_exact_match_only(tmp_path):
+    path = tmp_path / "c.jsonl"
+    data = {"totalSize": 1, "records": [{"Name": "pwd", "Note": "pw"}]}
+    record(path, [("query", {"soql": "select pwd from x"}, data)], secrets=["pw"])
+
+    entry = json.loads(path.read_text())
+    assert entry["arguments"] == {"soql": "select pwd from x"}
+    assert entry["response"] == [{"totalSize": 1, "records": [{"Name": "pwd", "Note": REDACTED}]}]
+
+
+def test_secret_substrings_redacted_in_errors(tmp_path):
+    path = tmp_path / "c.jsonl"
+    record(path, [("query", {"soql": "bad"}, RuntimeError("login failed for password hunter2"))], secrets=["hunter2"])
+
+    assert json.loads(path.read_text())["error"] == f"login failed for password {REDACTED}"
+
+
+def test_recorded_error_is_raised(tmp_path):
+    path = tmp_path / "c.jsonl"
+    record(path, [("query", {"soql": "bad"}, RuntimeError("MALFORMED_QUERY"))])
+
+    with pytest.raises(ReplayedError, match="MALFORMED_QUERY"):
+        replay(path, [("query", {"soql": "bad"})])
+
+
+def test_repeated_calls_replay_in_order(tmp_path):
+    path = tmp_path / "c.jsonl"
+    args = {"object": "Account", "fields": {"Name": "Acme"}}
+    record(path, [
+        ("create", args, {"id": "001A"}),
+        ("create", args, {"id": "001B"}),
+    ])
+
+    assert replay(path, [("create", args), ("create", args)]) == [{"id": "001A"}, {"id": "001B"}]
+
+
+def test_exhausted_recordings_raise_unless_looping(tmp_path):
+    path = tmp_path / "c.jsonl"
+    args = {"object": "Account", "fields": {"Name": "Acme"}}
+    record(path, [("create", args, {"id": "001A"})])
+
+    with pytest.raises(ValueError, match="used up"):
+        replay(path, [("create", args), ("create", args)])
+
+    assert replay(path, [("create", args), ("create", args)], loop=True) == [{"id": "001A"}, {"id": "001A"}]
+
+
+def test_recording_failure_does_not_change_live_result(tmp_path):
+    async def run():
+        cassette = Cassette(str(tmp_path / "c.jsonl"))
+
+        async def dispatch(tool_name, arguments):
+            return ToolResult([Content("not json")])
+
+        live = await make_client(cassette, dispatch).call_tool("create", {"object": "Account", "fields": {}})
+        cassette.close()
+        return live
+
+    assert asyncio.run(run()).content[0].text == "not json"
+
+
+def test_recording_failure_keeps_original_error(tmp_path):
+    async def run():
+        cassette = Cassette(str(tmp_path / "c.jsonl"))
+        cassette.close()
+
+        async def dispatch(tool_name, arguments):
+            raise RuntimeError("INVALID_FIELD")
+
+        await make_client(cassette, dispatch).call_tool("query", {"soql": "bad"})
+
+    with pytest.raises(RuntimeError, match="INVALID_FIELD"):
+        asyncio.run(run())
+
+
+@pytest.mark.parametrize("speed, expected", [(1.0, [0.5, 0.25]), (10.0, [0.05, 0.025]), (0, [])])
+def test_replay_scales_recorded_latency(tmp_path, monkeypatch, speed, expected):
+    path = tmp_path / "c.jsonl"
+    path.write_text(
+        json.dumps({"tool": "query", "arguments": {"soql": "a"}, "at": 0, "elapsed": 0.5, "response": [{}]}) + "\n"
+        + json.dumps({"tool": "query", "arguments": {"soql": "b"}, "at": 1, "elapsed": 0.25, "response": [{}]}) + "\n"
+    )
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    async def run():
+        client = ReplayMCPClient(str(path), speed=speed)
+        await client.call_tool("query", {"soql": "a"})
+        await client.call_tool("query", {"soql": "b"})
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    asyncio.run(run())
+
+    assert slept == pytest.approx(expected)
@@ -0,0 +1,86 @@
+"""
+Tests for SalesforceMCP record/replay mode selection
+"""
+import asyncio
+
+import pytest
+
+from backend.mcp_salesforce import SalesforceMCP
+from backend.cassette import ReplayMCPClient
+
+
+ENV_VARS = [
+    "SALESFORCE_USERNAME", "SALESFORCE_PASSWORD", "SALESFORCE_SECURITY_TOKEN",
+    "MCP_RECORD_CASSETTE", "MCP_REPLAY_CASSETTE", "MCP_REPLAY_SPEED", "MCP_REPLAY_LOOP",
+]
+
+
+@pytest.fixture
+def env(monkeypatch):
+    for name in ENV_VARS:
+        monkeypatch.delenv(name, raising=False)
+    return monkeypatch
+
+
+@pytest.fixture
+def cassette_path(tmp_path):
+    path = tmp_path / "c.jsonl"
+    path.write_text("")
+    return str(path)
+
+
+def test_record_and_replay_are_exclusive(env, cassette_path):
+    env.setenv("MCP_RECORD_CASSETTE", cassette_path)
+    env.setenv("MCP_REPLAY_CASSETTE", cassette_path)
+
+    with pytest.raises(ValueError, match="only one"):
+        SalesforceMCP()
+
+
+def test_replay_runs_without_credentials(env, cassette_path):
+    env.setenv("MCP_REPLAY_CASSETTE", cassette_path)
+
+    mcp = SalesforceMCP()
+    client = asyncio.run(mcp.initialize())
+
+    assert isinstance(client, ReplayMCPClient)
+    assert mcp.cassette is None
+
+
+def test_replay_defaults(env, cassette_path):
+    env.setenv("MCP_REPLAY_CASSETTE", cassette_path)
+
+    mcp = SalesforceMCP()
+
+    assert mcp.replay_client.speed == 1.0
+    assert mcp.replay_client.loop is False
+
+
+@pytest.mark.parametrize("loop, expected", [("1", True), ("true", True), ("YES", True), ("0", False), ("", False)])
+def test_replay_env_parsing(env, cassette_path, loop, expected):
+    env.setenv("MCP_REPLAY_CASSETTE", cassette_path)
+    env.setenv("MCP_REPLAY_SPEED", "2.5")
+    env.setenv("MCP_REPLAY_LOOP", loop)
+
+    mcp = SalesforceMCP()
+
+    assert mcp.replay_client.speed == 2.5
+    assert mcp.replay_client.loop is expected
+
+
+def test_live_mode_requires_credentials(env):
+    with pytest.raises(ValueError, match="Missing Salesforce credentials"):
+        SalesforceMCP()
+
+
+def test_record_mode_redacts_credentials(env, tmp_path):
+    env.setenv("SALESFORCE_USERNAME", "user@example.com")
+    env.setenv("SALESFORCE_PASSWORD", "hunter2")
+    env.setenv("SALESFORCE_SECURITY_TOKEN", "tok123")
+    env.setenv("MCP_RECORD_CASSETTE", str(tmp_path / "c.jsonl"))
+
+    mcp = SalesforceMCP()
+    mcp.cassette.close()
+
+    assert mcp.replay_client is None
+    assert mcp.cassette.secrets == {"hunter2", "tok123"}
@@ -0,0 +1,101 @@
+"""
+Tests for the /query replay driver
+"""
+import asyncio
+import json
+import sys
+
+import pytest
+
+from backend.replay_driver import drive
+
+
+def write_queries(path, entries):
+    path.write_text("".join(json.dumps(entry) + "\n" for entry in entries))
+
+
+def test_failed_requests_counted_as_errors(tmp_path):
+    path = tmp_path / "c.jsonl"
+    write_queries(path, [{"query": "show contacts", "at": t} for t in (0, 1, 2)])
+    responses = iter([
+        {"response": "✅ Found 2 contacts", "data": {}},
+        {"response": "✅ Found 2 contacts", "data": {}},
+        {"response": "❌ Error: Recorded responses for tool 'query' used up after 2 calls", "data": {}},
+    ])
+
+    async def handler(text):
+        return next(responses)
+
+    stats = asyncio.run(drive(str(path), speed=0, handler=handler))
+
+    assert stats["requests"] == 2
+    assert stats["errors"] == 1
+
+
+def test_all_failed_reports_no_throughput(tmp_path):
+    path = tmp_path / "c.jsonl"
+    write_queries(path, [{"query": "show contacts", "at": 0}])
+
+    async def handler(text):
+        return None
+
+    stats = asyncio.run(drive(str(path), speed=0, handler=handler))
+
+    assert stats["requests"] == 0
+    assert stats["errors"] == 1
+    assert stats["throughput"] is None
+
+
+def test_arrival_offsets_scaled_by_speed(tmp_path, monkeypatch):
+    path = tmp_path / "c.jsonl"
+    write_queries(path, [
+        {"tool": "query", "arguments": {}, "at": 0.5, "elapsed": 0.1, "response": [{}]},
+        {"query": "show contacts", "at": 2.0},
+        {"query": "show accounts", "at": 6.0},
+    ])
+    slept = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    async def handler(text):
+        return {"response": "✅ ok", "data": {}}
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    stats = asyncio.run(drive(str(path), speed=4.0, handler=handler))
+
+    assert sorted(slept) == pytest.approx([0.0, 1.0])
+    assert stats["requests"] == 2
+
+
+def test_no_recorded_queries(tmp_path):
+    path = tmp_path / "c.jsonl"
+    write_queries(path, [{"tool": "query", "arguments": {}, "at": 0, "elapsed": 0, "response": [{}]}])
+
+    with pytest.raises(ValueError, match="No recorded /query"):
+        asyncio.run(drive(str(path), speed=0, handler=None))
+
+
+def test_exhausted_replay_through_query_endpoint(tmp_path, monkeypatch):
+    pytest.importorskip("fastapi")
+    path = tmp_path / "c.jsonl"
+    soql = "SELECT Id, FirstName, LastName, Name, Email, Phone, Title, CreatedDate FROM Contact ORDER BY CreatedDate DESC LIMIT 50"
+    contacts = {"totalSize": 1, "records": [{"Name": "Ada Lovelace"}]}
+    write_queries(path, [
+        {"query": "show contacts", "at": 0},
+        {"tool": "query", "arguments": {"soql": soql}, "at": 0, "elapsed": 0.01, "response": [contacts]},
+        {"query": "show contacts", "at": 1},
+        {"tool": "query", "arguments": {"soql": soql}, "at": 1, "elapsed": 0.01, "response": [contacts]},
+        {"query": "show contacts", "at": 2},
+    ])
+    monkeypatch.setenv("MCP_REPLAY_CASSETTE", str(path))
+    monkeypatch.setenv("MCP_REPLAY_SPEED", "0")
+    monkeypatch.delenv("MCP_RECORD_CASSETTE", raising=False)
+    monkeypatch.delenv("MCP_REPLAY_LOOP", raising=False)
+    # backend.main builds its SalesforceMCP from the environment at import time
+    monkeypatch.delitem(sys.modules, "backend.main", raising=False)
+
+    stats = asyncio.run(drive(str(path), speed=0))
+
+    assert stats["requests"] == 2
+    assert stats["errors"] == 1